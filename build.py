@@ -22,68 +22,105 @@ _config.IS_DEVELOPMENT_MODE = False
 
 import cadquery as cq
 import timeit
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from turnbuckle import *
-from typing import Any, Callable
+from typing import Any, Callable, Dict
 
 
-def _timeit(fn: Callable) -> Any:
+step_dir = Path('.') / 'build' / 'step'
+
+def _timeit(description: str, fn: Callable) -> Any:
+    print(f'Building {description}')
     start_time = timeit.default_timer()
     part = fn()
     elapsed_time = timeit.default_timer() - start_time
-    print(f'Took: {elapsed_time:.3f}s')
-    print()
+    print(f'Built {description}, took: {elapsed_time:.3f}s')
     return part
 
-print('Building body')
-body_part = _timeit(lambda: body(
-    take_up_length=take_up_length,
-    thread_diameter=thread_diameter_internal,
-    thread_pitch=thread_pitch,
-    handle_diameter=handle_diameter
-))
-
-print('Building left-threaded eye end fitting')
-eye_end_fitting_part_left = _timeit(lambda:eye_end_fitting(
-    diameter=thread_diameter_external,
-    pitch=thread_pitch,
-    take_up_length=take_up_length,
-    eye_inner_radius=eye_inner_radius,
-    hand='left'
-).rotateAboutCenter((1, 0, 0), -90))
+# The part functions keep finished parts in their own cache, see _cached_part()
+# in turnbuckle.py.  A part loaded from it is reported as such, not timed as a
+# build.
+def _build(
+    name: str,
+    description: str,
+    part_fn: Callable[..., cq.Workplane],
+    params: Dict[str, Any],
+    transform: Callable[[cq.Workplane], cq.Workplane] = lambda part: part
+):
+    if part_fn.is_cached(**params):
+        print(f'Loading {description} from the build cache')
+        part = part_fn(**params)
+    else:
+        part = _timeit(description, lambda: part_fn(**params))
+    cq.exporters.export(transform(part), str(step_dir / f'{name}.step'))
 
-print('Building right-threaded eye end fitting')
-eye_end_fitting_part_right = _timeit(lambda: eye_end_fitting(
-    diameter=thread_diameter_external,
-    pitch=thread_pitch,
-    take_up_length=take_up_length,
-    eye_inner_radius=eye_inner_radius,
-    hand='right'
-).rotateAboutCenter((1, 0, 0), -90))
+# The parts are built and exported in separate processes, so that the exports
+# overlap just like the builds do.  The tasks get all of their parameters as
+# arguments and live in this module, so that the workers can import them no
+# matter how they are started (fork, spawn or forkserver)
+def _build_body(**params):
+    _build('body', 'body', body, params)
 
-print('Building left-threaded hook end fitting')
-hook_end_fitting_part_left = _timeit(lambda: hook_end_fitting(
-    diameter=thread_diameter_external,
-    pitch=thread_pitch,
-    take_up_length=take_up_length,
-    hook_inner_radius=hook_inner_radius,
-    hand='left'
-).rotateAboutCenter((1, 0, 0), -90))
+def _build_end_fittings(name: str, fitting_fn: Callable, **params):
+    # Both hands are built in one go, so that they share the same thread
+    for hand in ('left', 'right'):
+        _build(
+            f'{name}_{hand}',
+            f'{hand}-threaded {name.replace("_", " ")}',
+            fitting_fn,
+            dict(hand=hand, **params),
+            lambda part: part.rotateAboutCenter((1, 0, 0), -90)
+        )
 
-print('Building right-threaded hook end fitting')
-hook_end_fitting_part_right = _timeit(lambda: hook_end_fitting(
-    diameter=thread_diameter_external,
-    pitch=thread_pitch,
-    take_up_length=take_up_length,
-    hook_inner_radius=hook_inner_radius,
-    hand='right'
-).rotateAboutCenter((1, 0, 0), -90))
+def build_parts(
+    thread_diameter_external: float,
+    thread_diameter_internal: float,
+    thread_pitch: float,
+    take_up_length: float,
+    handle_diameter: float,
+    eye_inner_radius: float,
+    hook_inner_radius: float
+):
+    step_dir.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        builds = [
+            executor.submit(
+                _build_body,
+                take_up_length=take_up_length,
+                thread_diameter=thread_diameter_internal,
+                thread_pitch=thread_pitch,
+                handle_diameter=handle_diameter
+            ),
+            executor.submit(
+                _build_end_fittings,
+                'eye_end_fitting',
+                eye_end_fitting,
+                diameter=thread_diameter_external,
+                pitch=thread_pitch,
+                take_up_length=take_up_length,
+                eye_inner_radius=eye_inner_radius
+            ),
+            executor.submit(
+                _build_end_fittings,
+                'hook_end_fitting',
+                hook_end_fitting,
+                diameter=thread_diameter_external,
+                pitch=thread_pitch,
+                take_up_length=take_up_length,
+                hook_inner_radius=hook_inner_radius
+            )
+        ]
+        for build in builds:
+            build.result()
 
-model_format = 'step'
-build_dir = Path('.') / 'build' / model_format
-build_dir.mkdir(parents=True, exist_ok=True)
-cq.exporters.export(body_part, str(build_dir / f'body.{model_format}'))
-cq.exporters.export(eye_end_fitting_part_left, str(build_dir / f'eye_end_fitting_left.{model_format}'))
-cq.exporters.export(eye_end_fitting_part_right, str(build_dir / f'eye_end_fitting_right.{model_format}'))
-cq.exporters.export(hook_end_fitting_part_left, str(build_dir / f'hook_end_fitting_left.{model_format}'))
-cq.exporters.export(hook_end_fitting_part_right, str(build_dir / f'hook_end_fitting_right.{model_format}'))
+if __name__ == '__main__':
+    build_parts(
+        thread_diameter_external=thread_diameter_external,
+        thread_diameter_internal=thread_diameter_internal,
+        thread_pitch=thread_pitch,
+        take_up_length=take_up_length,
+        handle_diameter=handle_diameter,
+        eye_inner_radius=eye_inner_radius,
+        hook_inner_radius=hook_inner_radius
+    )
@@ -22,8 +22,16 @@
 # Left hand threads can be created by employing one of the "mirror" operations.
 # Thanks for taking the time to understand and use this code!
 
+import functools
+import inspect
 import math
 import cadquery as cq
+from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire
+from OCP.BRepLib import BRepLib
+from OCP.GCE2d import GCE2d_MakeSegment
+from OCP.Geom import Geom_CylindricalSurface
+from OCP.Geom2d import Geom2d_Line
+from OCP.gp import gp_Ax3, gp_Dir, gp_Dir2d, gp_Pnt, gp_Pnt2d
 
 ###############################################################################
 # The functions which have names preceded by '__' are not meant to be called
@@ -41,12 +49,18 @@ def metric_thread_angle():
 def __deg2rad(degrees):
     return degrees * math.pi / 180
 
+# The tangent of the thread angle (and its inverse) is needed all over the
+# place, so compute it only once.
+__TAN_ANGLE = math.tan(__deg2rad(metric_thread_angle()))
+__INV_TAN_ANGLE = 1.0 / __TAN_ANGLE
+
 # In the absence of flat thread valley and flattened thread tip, returns the
 # amount by which the thread "triangle" protrudes outwards (radially) from base
 # cylinder in the case of external thread, or the amount by which the thread
 # "triangle" protrudes inwards from base tube in the case of internal thread.
+@functools.lru_cache(maxsize=None)
 def metric_thread_perfect_height(pitch):
-    return pitch / (2 * math.tan(__deg2rad(metric_thread_angle())))
+    return pitch * 0.5 * __INV_TAN_ANGLE
 
 # Up the radii of internal (female) thread in order to provide a little bit of
 # wiggle room around male thread.  Right now input parameter 'diameter' is
@@ -58,6 +72,7 @@ def __metric_thread_internal_radius_increase(diameter, pitch):
     return 0.1 * metric_thread_perfect_height(pitch)
 
 # Returns the major radius of thread, which is always the greater of the two.
+@functools.lru_cache(maxsize=None)
 def metric_thread_major_radius(diameter, pitch, internal=False):
     return (__metric_thread_internal_radius_increase(diameter, pitch) if
             internal else 0.0) + (diameter / 2)
@@ -69,6 +84,7 @@ def __metric_thread_effective_ratio():
     return 0.7
 
 # Returns the minor radius of thread, which is always the lesser of the two.
+@functools.lru_cache(maxsize=None)
 def metric_thread_minor_radius(diameter, pitch, internal=False):
     return (metric_thread_major_radius(diameter, pitch, internal)
             - (__metric_thread_effective_ratio() *
@@ -90,8 +106,9 @@ def metric_thread_perfect_minor_radius(diameter, pitch, internal=False):
 # Returns the lead-in and/or chamfer distance along the z axis of rotation.
 # The lead-in/chamfer only depends on the pitch and is made with the same angle
 # as the thread, that being 30 degrees offset from radial.
+@functools.lru_cache(maxsize=None)
 def metric_thread_lead_in(pitch, internal=False):
-    return (math.tan(__deg2rad(metric_thread_angle()))
+    return (__TAN_ANGLE
             * (metric_thread_major_radius(256.0, pitch, internal)
                - metric_thread_minor_radius(256.0, pitch, internal)))
 
@@ -102,6 +119,71 @@ def metric_thread_relief(pitch):
     return (1.0 - __metric_thread_effective_ratio()) * pitch / 2
 
 
+# Returns a right-handed helix around the z axis, starting at height 'z_start'
+# and at angle 'angle_start' (in degrees) from the x axis.  This is the same
+# helix as made by cq.Wire.makeHelix(), only built directly in its final place
+# rather than being translated and rotated there afterwards.
+def __make_helix(pitch, height, radius, z_start, angle_start):
+    angle = __deg2rad(angle_start)
+    surface = Geom_CylindricalSurface(gp_Ax3(gp_Pnt(0,0,z_start),
+                                             gp_Dir(0,0,1),
+                                             gp_Dir(math.cos(angle),
+                                                    math.sin(angle), 0)),
+                                      radius)
+    line = Geom2d_Line(gp_Pnt2d(0.0, 0.0), gp_Dir2d(2 * math.pi, pitch))
+    n_turns = height / pitch
+    segment = GCE2d_MakeSegment(line.Value(0.0),
+                                line.Value(n_turns * math.sqrt(
+                                    (2 * math.pi) ** 2 + pitch ** 2))).Value()
+    edge = BRepBuilderAPI_MakeEdge(segment, surface).Edge()
+    wire = BRepBuilderAPI_MakeWire(edge).Wire()
+    BRepLib.BuildCurves3d_s(wire, 1e-6, MaxSegment=2000)
+    return cq.Wire(wire)
+
+# Splits the threads by the horizontal plane at height 'z' and keeps the solids
+# lying above the plane if 'keep_above' is set, or those below it otherwise.
+# A planar split is considerably cheaper than cutting away a box.
+def __split_threads(threads, z, size, keep_above):
+    plane = cq.Face.makePlane(size, size, basePnt=(0,0,z), dir=(0,0,1))
+    solids = threads.val().split(plane).Solids()
+    kept = [solid for solid in solids if (solid.Center().z > z) == keep_above]
+    return threads.newObject([cq.Compound.makeCompound(kept)])
+
+
+###############################################################################
+# Generating the threads is by far the most expensive part of building a model
+# (helical sweep followed by several boolean operations), and the same threads
+# tend to be requested over and over again.  Results are therefore memoized on
+# the full set of arguments; floats are rounded so that FP noise in computed
+# dimensions does not defeat the cache.  A copy of the cached shape is handed
+# out on every call, so that the caller is free to do with it as it pleases.
+# None of the boolean operations clean() their result, as unifying the faces of
+# a long thread over and over is expensive; cleaning them is left up to the
+# part that the threads end up in.
+###############################################################################
+__thread_cache = {}
+
+def __thread_cache_key(func, args, kwargs):
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return (func.__name__,) + tuple(
+        (name, round(value, 6) if isinstance(value, float) else value)
+        for name, value in bound.arguments.items())
+
+def __cached_thread(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = __thread_cache_key(func, args, kwargs)
+        cached = __thread_cache.get(key)
+        if cached is None:
+            cached = func(*args, **kwargs)
+            if len(cached.vals()) != 1:
+                raise ValueError("Threads must be a single shape.")
+            __thread_cache[key] = cached
+        return cq.Workplane(cached.plane, obj=cached.val().copy())
+    return wrapper
+
+
 ###############################################################################
 # A few words on modules external_metric_thread() and internal_metric_thread().
 # The parameter 'z_start' is added as a convenience in order to make the male
@@ -117,6 +199,7 @@ def metric_thread_relief(pitch):
 # budge in the minor radius, inwards, so that overlaps would be created with
 # inner cylinders.  (Does not affect thread profile outside of cylinder.)
 ###############################################################################
+@__cached_thread
 def external_metric_thread(diameter,  # Required parameter, e.g. 3.0 for M3x0.5
                            pitch,     # Required parameter, e.g. 0.5 for M3x0.5
                            length,    # Required parameter, e.g. 2.0
@@ -144,67 +227,74 @@ def external_metric_thread(diameter,  # Required parameter, e.g. 3.0 for M3x0.5
         t_length      = t_length - (2 * z_off)
     if top_relief:
         t_length      = t_length - (2 * z_off)
+    major_r           = metric_thread_major_radius(diameter,pitch)
     outer_r           = (force_outer_radius if (force_outer_radius > 0.0) else
-                         metric_thread_major_radius(diameter,pitch))
+                         major_r)
     inner_r           = metric_thread_minor_radius(diameter,pitch)
+    delta_r           = outer_r - inner_r # Used by lead-ins.
+    rise              = __TAN_ANGLE * delta_r
     epsilon           = 0
     inner_r_adj       = inner_r
     inner_z_budge     = 0
     if use_epsilon:
-        epsilon       = (z_off/3) / math.tan(__deg2rad(metric_thread_angle()))
+        epsilon       = (z_off/3) * __INV_TAN_ANGLE
         inner_r_adj   = inner_r - epsilon
-        inner_z_budge = math.tan(__deg2rad(metric_thread_angle())) * epsilon
+        inner_z_budge = __TAN_ANGLE * epsilon
 
     if envelope:
         threads = cq.Workplane("XZ")
-        threads = threads.moveTo(inner_r_adj, -pitch)
-        threads = threads.lineTo(outer_r, -pitch)
-        threads = threads.lineTo(outer_r, t_length + pitch)
-        threads = threads.lineTo(inner_r_adj, t_length + pitch)
+        threads = threads.polyline([
+            (inner_r_adj, -pitch),
+            (outer_r, -pitch),
+            (outer_r, t_length + pitch),
+            (inner_r_adj, t_length + pitch)])
         threads = threads.close()
         threads = threads.revolve()
 
     else: # Not envelope, cut the threads.
-        wire = cq.Wire.makeHelix(pitch=pitch*n_starts,
-                                 height=t_length+pitch,
-                                 radius=inner_r)
-        wire = wire.translate((0,0,-pitch/2))
-        wire = wire.rotate(startVector=(0,0,0), endVector=(0,0,1),
-                           angleDegrees=360*(-pitch/2)/(pitch*n_starts))
-        d_mid = ((metric_thread_major_radius(diameter,pitch) - outer_r)
-                 * math.tan(__deg2rad(metric_thread_angle())))
+        wire = __make_helix(pitch=pitch*n_starts,
+                            height=t_length+pitch,
+                            radius=inner_r,
+                            z_start=-pitch/2,
+                            angle_start=360*(-pitch/2)/(pitch*n_starts))
+        d_mid = (major_r - outer_r) * __TAN_ANGLE
         thread = cq.Workplane("XZ")
-        thread = thread.moveTo(inner_r_adj, -pitch/2 + z_off - inner_z_budge)
-        thread = thread.lineTo(outer_r, -(z_off + d_mid))
-        thread = thread.lineTo(outer_r, z_off + d_mid)
-        thread = thread.lineTo(inner_r_adj, pitch/2 - z_off + inner_z_budge)
+        thread = thread.polyline([
+            (inner_r_adj, -pitch/2 + z_off - inner_z_budge),
+            (outer_r, -(z_off + d_mid)),
+            (outer_r, z_off + d_mid),
+            (inner_r_adj, pitch/2 - z_off + inner_z_budge)])
         thread = thread.close()
-        thread = thread.sweep(wire, isFrenet=True)
-        threads = thread
+        # Sweep the profile directly, Workplane.sweep() would follow up with a
+        # pointless (and for long threads very slow) clean() of the result.
+        # The exact Frenet frame is needed.  Neither the corrected Frenet frame
+        # of isFrenet=False nor a fixed frame keeps the profile in the axial
+        # plane of the helix, and the thread comes out misshapen.
+        thread = cq.Workplane("XZ", obj=cq.Solid.sweep(thread.val(), [], wire,
+                                                        makeSolid=True,
+                                                        isFrenet=True))
+        # The starts never overlap, so there is no need to fuse them.
+        starts = [thread.val()]
         for addl_start in range(1, n_starts):
             thread = thread.rotate(axisStartPoint=(0,0,0),
                                    axisEndPoint=(0,0,1),
                                    angleDegrees=360/n_starts)
-            threads = threads.union(thread)
+            starts.append(thread.val())
+        threads = thread.newObject([cq.Compound.makeCompound(starts)])
 
-    square_shave = cq.Workplane("XY")
-    square_shave = square_shave.box(length=outer_r*3, width=outer_r*3,
-                                    height=pitch*2, centered=True)
-    square_shave = square_shave.translate((0,0,-pitch)) # Because centered.
-    # Always cut the top and bottom square.  Otherwise things don't play nice.
-    threads = threads.cut(square_shave)
+    # Always trim the bottom and the top.  Otherwise things don't play nice.
+    threads = __split_threads(threads, 0.0, outer_r*3, keep_above=True)
 
     if bottom_lead_in:
-        delta_r = outer_r - inner_r
-        rise = math.tan(__deg2rad(metric_thread_angle())) * delta_r
         lead_in = cq.Workplane("XZ")
-        lead_in = lead_in.moveTo(inner_r - delta_r, -rise)
-        lead_in = lead_in.lineTo(outer_r + delta_r, 2 * rise)
-        lead_in = lead_in.lineTo(outer_r + delta_r, -pitch - rise)
-        lead_in = lead_in.lineTo(inner_r - delta_r, -pitch - rise)
+        lead_in = lead_in.polyline([
+            (inner_r - delta_r, -rise),
+            (outer_r + delta_r, 2 * rise),
+            (outer_r + delta_r, -pitch - rise),
+            (inner_r - delta_r, -pitch - rise)])
         lead_in = lead_in.close()
         lead_in = lead_in.revolve()
-        threads = threads.cut(lead_in)
+        threads = threads.cut(lead_in, clean=False)
 
     # This was originally a workaround to the anomalous B-rep computation where
     # the top of base cylinder is flush with top of threads, without the use of
@@ -222,36 +312,35 @@ def external_metric_thread(diameter,  # Required parameter, e.g. 3.0 for M3x0.5
         cyl = cyl.rotate(axisStartPoint=(0,0,0), axisEndPoint=(0,0,1),
                          angleDegrees=-(360*t_start/(pitch*n_starts)))
         cyl = cyl.translate((0,0,-t_start+(z_start-cyl_extend_bottom)))
-        threads = threads.union(cyl)
+        threads = threads.union(cyl, clean=False)
 
     # Next, make cuts at the top.
-    square_shave = square_shave.translate((0,0,pitch*2+t_length))
-    threads = threads.cut(square_shave)
+    threads = __split_threads(threads, t_length, outer_r*3, keep_above=False)
 
     if top_lead_in:
-        delta_r = outer_r - inner_r
-        rise = math.tan(__deg2rad(metric_thread_angle())) * delta_r
         lead_in = cq.Workplane("XZ")
-        lead_in = lead_in.moveTo(inner_r - delta_r, t_length + rise)
-        lead_in = lead_in.lineTo(outer_r + delta_r, t_length - (2 * rise))
-        lead_in = lead_in.lineTo(outer_r + delta_r, t_length + pitch + rise)
-        lead_in = lead_in.lineTo(inner_r - delta_r, t_length + pitch + rise)
+        lead_in = lead_in.polyline([
+            (inner_r - delta_r, t_length + rise),
+            (outer_r + delta_r, t_length - (2 * rise)),
+            (outer_r + delta_r, t_length + pitch + rise),
+            (inner_r - delta_r, t_length + pitch + rise)])
         lead_in = lead_in.close()
         lead_in = lead_in.revolve()
-        threads = threads.cut(lead_in)
+        threads = threads.cut(lead_in, clean=False)
 
-    # Place the threads into position.
-    threads = threads.translate((0,0,t_start))
-    if (not envelope):
-        threads = threads.rotate(axisStartPoint=(0,0,0), axisEndPoint=(0,0,1),
-                                 angleDegrees=360*t_start/(pitch*n_starts))
+    # Place the threads into position.  Rotation and translation are combined
+    # into a single location, which is applied without copying the shape.
+    placement = cq.Location(cq.Vector(0,0,t_start), cq.Vector(0,0,1),
+                            0 if envelope else 360*t_start/(pitch*n_starts))
+    threads = threads.newObject([obj.moved(placement)
+                                 for obj in threads.vals()])
 
     if render_cyl_late:
         cyl = cq.Workplane("XY")
         cyl = cyl.circle(radius=inner_r)
         cyl = cyl.extrude(until=length+cyl_extend_bottom+cyl_extend_top)
         cyl = cyl.translate((0,0,z_start-cyl_extend_bottom))
-        threads = threads.union(cyl)
+        threads = threads.union(cyl, clean=False)
 
     return threads
 
@@ -263,6 +352,7 @@ def external_metric_thread(diameter,  # Required parameter, e.g. 3.0 for M3x0.5
 # in the major radius, outwards, so that overlaps would be created with outer
 # tubes.  (Does not affect thread profile inside of tube or beyond extents.)
 ###############################################################################
+@__cached_thread
 def internal_metric_thread(diameter,  # Required parameter, e.g. 3.0 for M3x0.5
                            pitch,     # Required parameter, e.g. 0.5 for M3x0.5
                            length,    # Required parameter, e.g. 2.0.
@@ -295,67 +385,74 @@ def internal_metric_thread(diameter,  # Required parameter, e.g. 3.0 for M3x0.5
                                                     internal=True)
     inner_r            = metric_thread_minor_radius(diameter,pitch,
                                                     internal=True)
+    delta_r            = outer_r - inner_r # Used by chamfers.
+    rise               = __TAN_ANGLE * delta_r
     epsilon            = 0
     outer_r_adj        = outer_r
     outer_z_budge      = 0
     if use_epsilon:
         # High values of 'epsilon' sometimes cause entire starts to disappear.
-        epsilon        = (z_off/5) / math.tan(__deg2rad(metric_thread_angle()))
+        epsilon        = (z_off/5) * __INV_TAN_ANGLE
         outer_r_adj    = outer_r + epsilon
-        outer_z_budge  = math.tan(__deg2rad(metric_thread_angle())) * epsilon
+        outer_z_budge  = __TAN_ANGLE * epsilon
 
     if envelope:
         threads = cq.Workplane("XZ")
-        threads = threads.moveTo(outer_r_adj, -pitch)
-        threads = threads.lineTo(inner_r, -pitch)
-        threads = threads.lineTo(inner_r, t_length + pitch)
-        threads = threads.lineTo(outer_r_adj, t_length + pitch)
+        threads = threads.polyline([
+            (outer_r_adj, -pitch),
+            (inner_r, -pitch),
+            (inner_r, t_length + pitch),
+            (outer_r_adj, t_length + pitch)])
         threads = threads.close()
         threads = threads.revolve()
 
     else: # Not envelope, cut the threads.
-        wire = cq.Wire.makeHelix(pitch=pitch*n_starts,
-                                 height=t_length+pitch,
-                                 radius=inner_r)
-        wire = wire.translate((0,0,-pitch/2))
-        wire = wire.rotate(startVector=(0,0,0), endVector=(0,0,1),
-                           angleDegrees=360*(-pitch/2)/(pitch*n_starts))
+        wire = __make_helix(pitch=pitch*n_starts,
+                            height=t_length+pitch,
+                            radius=inner_r,
+                            z_start=-pitch/2,
+                            angle_start=360*(-pitch/2)/(pitch*n_starts))
         thread = cq.Workplane("XZ")
-        thread = thread.moveTo(outer_r_adj, -pitch/2 + z_off - outer_z_budge)
-        thread = thread.lineTo(inner_r, -z_off)
-        thread = thread.lineTo(inner_r, z_off)
-        thread = thread.lineTo(outer_r_adj, pitch/2 - z_off + outer_z_budge)
+        thread = thread.polyline([
+            (outer_r_adj, -pitch/2 + z_off - outer_z_budge),
+            (inner_r, -z_off),
+            (inner_r, z_off),
+            (outer_r_adj, pitch/2 - z_off + outer_z_budge)])
         thread = thread.close()
-        thread = thread.sweep(wire, isFrenet=True)
-        threads = thread
+        # Sweep the profile directly, Workplane.sweep() would follow up with a
+        # pointless (and for long threads very slow) clean() of the result.
+        # The exact Frenet frame is needed.  Neither the corrected Frenet frame
+        # of isFrenet=False nor a fixed frame keeps the profile in the axial
+        # plane of the helix, and the thread comes out misshapen.
+        thread = cq.Workplane("XZ", obj=cq.Solid.sweep(thread.val(), [], wire,
+                                                        makeSolid=True,
+                                                        isFrenet=True))
+        # The starts never overlap, so there is no need to fuse them.
+        starts = [thread.val()]
         for addl_start in range(1, n_starts):
             thread = thread.rotate(axisStartPoint=(0,0,0),
                                    axisEndPoint=(0,0,1),
                                    angleDegrees=360/n_starts)
-            threads = threads.union(thread)
+            starts.append(thread.val())
+        threads = thread.newObject([cq.Compound.makeCompound(starts)])
         # Rotate so that the external threads would align.
         threads = threads.rotate(axisStartPoint=(0,0,0), axisEndPoint=(0,0,1),
                                  angleDegrees=180/n_starts)
 
     square_len = max(outer_r*3, base_tube_od*1.125)
-    square_shave = cq.Workplane("XY")
-    square_shave = square_shave.box(length=square_len, width=square_len,
-                                    height=pitch*2, centered=True)
-    square_shave = square_shave.translate((0,0,-pitch)) # Because centered.
-    # Always cut the top and bottom square.  Otherwise things don't play nice.
-    threads = threads.cut(square_shave)
+    # Always trim the bottom and the top.  Otherwise things don't play nice.
+    threads = __split_threads(threads, 0.0, square_len, keep_above=True)
 
     if bottom_chamfer:
-        delta_r = outer_r - inner_r
-        rise = math.tan(__deg2rad(metric_thread_angle())) * delta_r
         chamfer = cq.Workplane("XZ")
-        chamfer = chamfer.moveTo(inner_r - delta_r, 2 * rise)
-        chamfer = chamfer.lineTo(outer_r + delta_r, -rise)
-        chamfer = chamfer.lineTo(outer_r + delta_r, -pitch - rise)
-        chamfer = chamfer.lineTo(inner_r - delta_r, -pitch - rise)
+        chamfer = chamfer.polyline([
+            (inner_r - delta_r, 2 * rise),
+            (outer_r + delta_r, -rise),
+            (outer_r + delta_r, -pitch - rise),
+            (inner_r - delta_r, -pitch - rise)])
         chamfer = chamfer.close()
         chamfer = chamfer.revolve()
-        threads = threads.cut(chamfer)
+        threads = threads.cut(chamfer, clean=False)
 
     # This was originally a workaround to the anomalous B-rep computation where
     # the top of base tube is flush with top of threads w/o the use of chamfer.
@@ -377,29 +474,28 @@ def internal_metric_thread(diameter,  # Required parameter, e.g. 3.0 for M3x0.5
         tube = tube.rotate(axisStartPoint=(0,0,0), axisEndPoint=(0,0,1),
                            angleDegrees=-(360*t_start/(pitch*n_starts)))
         tube = tube.translate((0,0,-t_start+(z_start-tube_extend_bottom)))
-        threads = threads.union(tube)
+        threads = threads.union(tube, clean=False)
 
     # Next, make cuts at the top.
-    square_shave = square_shave.translate((0,0,pitch*2+t_length))
-    threads = threads.cut(square_shave)
+    threads = __split_threads(threads, t_length, square_len, keep_above=False)
 
     if top_chamfer:
-        delta_r = outer_r - inner_r
-        rise = math.tan(__deg2rad(metric_thread_angle())) * delta_r
         chamfer = cq.Workplane("XZ")
-        chamfer = chamfer.moveTo(inner_r - delta_r, t_length - (2 * rise))
-        chamfer = chamfer.lineTo(outer_r + delta_r, t_length + rise)
-        chamfer = chamfer.lineTo(outer_r + delta_r, t_length + pitch + rise)
-        chamfer = chamfer.lineTo(inner_r - delta_r, t_length + pitch + rise)
+        chamfer = chamfer.polyline([
+            (inner_r - delta_r, t_length - (2 * rise)),
+            (outer_r + delta_r, t_length + rise),
+            (outer_r + delta_r, t_length + pitch + rise),
+            (inner_r - delta_r, t_length + pitch + rise)])
         chamfer = chamfer.close()
         chamfer = chamfer.revolve()
-        threads = threads.cut(chamfer)
+        threads = threads.cut(chamfer, clean=False)
 
-    # Place the threads into position.
-    threads = threads.translate((0,0,t_start))
-    if (not envelope):
-        threads = threads.rotate(axisStartPoint=(0,0,0), axisEndPoint=(0,0,1),
-                                 angleDegrees=360*t_start/(pitch*n_starts))
+    # Place the threads into position.  Rotation and translation are combined
+    # into a single location, which is applied without copying the shape.
+    placement = cq.Location(cq.Vector(0,0,t_start), cq.Vector(0,0,1),
+                            0 if envelope else 360*t_start/(pitch*n_starts))
+    threads = threads.newObject([obj.moved(placement)
+                                 for obj in threads.vals()])
 
     if render_tube_late:
         tube = cq.Workplane("XY")
@@ -407,6 +503,6 @@ def internal_metric_thread(diameter,  # Required parameter, e.g. 3.0 for M3x0.5
         tube = tube.circle(radius=outer_r)
         tube = tube.extrude(until=length+tube_extend_bottom+tube_extend_top)
         tube = tube.translate((0,0,z_start-tube_extend_bottom))
-        threads = threads.union(tube)
+        threads = threads.union(tube, clean=False)
 
     return threads
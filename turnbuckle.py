@@ -3,9 +3,13 @@ import core.config as _config
 
 import cadquery as cq
 import core.iso as iso
+import functools
+import hashlib
+import inspect
 import math
 from core.iso import MM
 from core.metric_threads import *
+from pathlib import Path
 
 if _config.IS_DEVELOPMENT_MODE:
     from ocp_vscode import *
@@ -13,17 +17,102 @@ if _config.IS_DEVELOPMENT_MODE:
 
 THREAD_MIRROR_PLANE = 'XZ'
 
+_PROJECT_DIR = Path(__file__).resolve().parent
+_BUILD_CACHE_DIR = _PROJECT_DIR / '.build_cache'
+_MODEL_SOURCES = [
+    _PROJECT_DIR / 'turnbuckle.py',
+    *(_PROJECT_DIR / 'core').glob('*.py')
+]
+
+def _cached_part(part_fn):
+    # Parts are pure functions of their parameters, so the finished shape is
+    # cached on disk, in the BREP format, keyed by a hash of the parameters.
+    # The cached shape is only used while it's newer than the model sources.
+    def cache_path(*args, **kwargs) -> Path:
+        params = inspect.signature(part_fn).bind(*args, **kwargs)
+        params.apply_defaults()
+        key = repr((part_fn.__name__, sorted(params.arguments.items())))
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return _BUILD_CACHE_DIR / f'{digest}.brep'
+
+    def is_cached(*args, **kwargs) -> bool:
+        if _config.IS_DEVELOPMENT_MODE:
+            return False
+
+        path = cache_path(*args, **kwargs)
+        sources_mtime = max(source.stat().st_mtime for source in _MODEL_SOURCES)
+        return path.exists() and path.stat().st_mtime > sources_mtime
+
+    @functools.wraps(part_fn)
+    def wrapper(*args, **kwargs):
+        if _config.IS_DEVELOPMENT_MODE:
+            return part_fn(*args, **kwargs)
+
+        path = cache_path(*args, **kwargs)
+        if is_cached(*args, **kwargs):
+            return cq.Workplane('XY', obj=cq.Shape.importBrep(str(path)))
+
+        part = part_fn(*args, **kwargs)
+        _BUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        part_path = path.with_suffix('.tmp')
+        part.val().exportBrep(str(part_path))
+        part_path.replace(path)
+        return part
+
+    wrapper.is_cached = is_cached
+    return wrapper
+
+@functools.lru_cache(maxsize=16)
+def _hand_marker_shape(radius: float, hand: str):
+    # One marker for the left hand, two opposite ones for the right hand
+    positions = [(0, -radius)] if hand == 'left' else [(0, -radius), (0, radius)]
+    return cq.Compound.makeCompound([
+        cq.Solid.makeSphere(
+            1*MM,
+            cq.Vector(x, y, 0),
+            angleDegrees1=-90,
+            angleDegrees2=90
+        )
+        for x, y in positions
+    ])
+
 def _hand_marker(radius: float, hand: str):
-    return (
-        cq.Workplane('XY')
-        .polarArray(radius, -90, 360, 1 if hand == 'left' else 2)
-        .sphere(1*MM)
-    )
+    return cq.Workplane('XY', obj=_hand_marker_shape(radius, hand).copy())
 
 def _cutter_thickness(diameter: float, angle_with_print_bed: float):
     return diameter * math.cos(math.radians(angle_with_print_bed))
+
+def _fitting_thread(
+    diameter: float,
+    pitch: float,
+    take_up_length: float,
+    cutter: cq.Workplane,
+    hand_marker: cq.Workplane,
+    hand: str
+):
+    # The cutter is symmetric with respect to the mirror plane, so the
+    # left-hand thread can be mirrored from the right-hand one before trimming
+    thread = cq.Workplane('XY').union(external_metric_thread(
+        diameter=diameter,
+        pitch=pitch,
+        length=take_up_length/2,
+        bottom_lead_in=True,
+        top_lead_in=False,
+        base_cylinder=True
+    ))
+    if hand == 'left':
+        thread = thread.mirror(THREAD_MIRROR_PLANE)
+    else:
+        hand_marker = hand_marker.mirror('XZ')
+
+    return (
+        thread
+        .intersect(cutter)
+        .cut(hand_marker)
+    )
 # %%
 
+@_cached_part
 def body(
     take_up_length: float,
     thread_diameter: float,
@@ -37,15 +126,22 @@ def body(
         thread_pitch = iso.Standard.M10_THREAD_PITCH_COARSE
         handle_diameter = 20*MM
 
-    body = (
-        cq.Workplane('XY')
-        .sketch()
-        .regularPolygon(handle_diameter/2, 6, 30)
-        .vertices()
-        .fillet(1*MM)
-        .finalize()
-        .extrude(take_up_length + 2*MM)
+    hexagon = cq.Wire.makePolygon(
+        [
+            cq.Vector(
+                handle_diameter/2 * math.cos(math.radians(i*60)),
+                handle_diameter/2 * math.sin(math.radians(i*60)),
+                0
+            )
+            for i in range(6)
+        ],
+        close=True
     )
+    hexagon = hexagon.fillet2D(1*MM, hexagon.Vertices())
+    body = cq.Workplane('XY', obj=cq.Solid.extrudeLinear(
+        cq.Face.makeFromWires(hexagon),
+        cq.Vector(0, 0, take_up_length + 2*MM)
+    ))
 
     bottom_left_hand_thread = internal_metric_thread(
         diameter=thread_diameter,
@@ -65,9 +161,11 @@ def body(
     body = (
         cq.Workplane('XY', obj=body.val())
         .faces('>Z')
-        .hole(thread_diameter)
-        .union(bottom_left_hand_thread)
-        .union(top_right_hand_thread)
+        .hole(thread_diameter, clean=False)
+        .union(
+            bottom_left_hand_thread.add(top_right_hand_thread),
+            clean=False
+        )
     )
 
     handle_side_length = (handle_diameter/2) * math.sqrt(3) / 2
@@ -82,7 +180,7 @@ def body(
         .vertices()
         .fillet(1*MM)
         .finalize()
-        .extrude(-handle_diameter, combine='s')
+        .extrude(-handle_diameter, combine='s', clean=False)
     )
 
     left_hand_marker = _hand_marker(handle_side_length, 'left')
@@ -93,8 +191,8 @@ def body(
 
     body = (
         cq.Workplane('XY', obj=body.val())
-        .cut(left_hand_marker)
-        .cut(righ_hand_marker)
+        .cut(left_hand_marker.add(righ_hand_marker), clean=False)
+        .clean()
     )
 
     if _config.IS_DEVELOPMENT_MODE:
@@ -102,6 +200,7 @@ def body(
 # %%
     return body
 
+@_cached_part
 def eye_end_fitting(
     diameter: float,
     pitch: float,
@@ -134,23 +233,14 @@ def eye_end_fitting(
         )
     )
 
-    hand_marker = _hand_marker(thickness/2, hand).mirror('XZ')
-
-    thread = (
-        cq.Workplane('XY')
-        .union(external_metric_thread(
-            diameter=diameter,
-            pitch=pitch,
-            length=take_up_length/2,
-            bottom_lead_in=True,
-            top_lead_in=False,
-            base_cylinder=True
-        ))
-        .intersect(cutter)
-        .cut(hand_marker)
+    thread = _fitting_thread(
+        diameter,
+        pitch,
+        take_up_length,
+        cutter,
+        _hand_marker(thickness/2, hand),
+        hand
     )
-    if hand == 'left':
-        thread = thread.mirror(THREAD_MIRROR_PLANE)
 
     revolve_axis_x = diameter/2 + eye_inner_radius
     eye = (
@@ -182,6 +272,7 @@ def eye_end_fitting(
 # %%
     return fitting
 
+@_cached_part
 def hook_end_fitting(
     diameter: float,
     pitch: float,
@@ -214,23 +305,14 @@ def hook_end_fitting(
         )
     )
 
-    hand_marker = _hand_marker(thickness/2, hand).mirror('XZ')
-
-    thread = (
-        cq.Workplane('XY')
-        .union(external_metric_thread(
-            diameter=diameter,
-            pitch=pitch,
-            length=take_up_length/2,
-            bottom_lead_in=True,
-            top_lead_in=False,
-            base_cylinder=True
-        ))
-        .intersect(cutter)
-        .cut(hand_marker)
+    thread = _fitting_thread(
+        diameter,
+        pitch,
+        take_up_length,
+        cutter,
+        _hand_marker(thickness/2, hand),
+        hand
     )
-    if hand == 'left':
-        thread = thread.mirror(THREAD_MIRROR_PLANE)
 
     hook_center_radius = hook_inner_radius + diameter/2
     path = (